@@ -32,12 +32,16 @@ def sanitize_filename(name, max_length=50, max_words=5):
     # Limit length
     return limited_name[:max_length] if limited_name else 'untitled'
 
-def process_files_by_date(file_paths, output_path, dry_run=False, silent=False, log_file=None):
-    """Process files to organize them by date."""
+def process_files_by_date(file_paths, output_path, dry_run=False, silent=False, log_file=None, mtimes=None):
+    """Process files to organize them by date.
+
+    mtimes, if given, holds the modification time of each file in file_paths
+    (e.g. from os.DirEntry.stat()) so the files don't need to be stat'ed again.
+    """
     operations = []
-    for file_path in file_paths:
+    for i, file_path in enumerate(file_paths):
         # Get the modification time
-        mod_time = os.path.getmtime(file_path)
+        mod_time = mtimes[i] if mtimes is not None else os.path.getmtime(file_path)
         # Convert to datetime
         mod_datetime = datetime.datetime.fromtimestamp(mod_time)
         year = mod_datetime.strftime('%Y')
@@ -2,201 +2,357 @@
 """
 Local File Organizer Diagnostic Script
 Run this to identify and fix common issues
+Use --format=plain (or diagnostic_simple.py) for output without emoji
 """
 
+import argparse
+import importlib
+import importlib.util
+import io
 import os
 import sys
+import threading
+import time
 import traceback
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Set LFO_DIAG_VERBOSE=1 to print full tracebacks for failed tests
+VERBOSE = os.environ.get("LFO_DIAG_VERBOSE") == "1"
+
+# NLTK packages the application needs, mapped to their location in an NLTK data directory
+_NLTK_PATHS = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+}
+
+# Message prefixes for each --format; 'plain' avoids emoji for consoles that can't display them
+_FORMATS = {
+    'rich': {
+        'pass': '✅ ', 'warn': '⚠️  ', 'fail': '❌ ', 'test': '🔍 ', 'step': '   ',
+        'run': '📋 ', 'summary': '📊 ', 'done': '🎉 ', 'hint': '💡 ',
+        'passed': '✅ PASS ', 'failed': '❌ FAIL ',
+    },
+    'plain': {
+        'pass': 'PASS: ', 'warn': 'WARNING: ', 'fail': 'FAIL: ', 'test': '', 'step': '',
+        'run': '', 'summary': '', 'done': '', 'hint': '',
+        'passed': 'PASS: ', 'failed': 'FAIL: ',
+    },
+}
+SYMBOLS = dict(_FORMATS['rich'])
+
+# Per-thread output buffer used while tests run in parallel (see run_test)
+_output = threading.local()
+_write_lock = threading.Lock()
+
+class _ThreadRoutedStream:
+    """Stand-in for sys.stdout/sys.stderr that sends a thread's writes to its buffer, if it has one.
+
+    Installed for the life of the test pool so that output from libraries
+    (file_utils, NLTK, ...) is captured along with the test's own prints.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = getattr(_output, 'buffer', None)
+        if buffer is not None:
+            return buffer.write(text)
+        with _write_lock:
+            return self._stream.write(text)
+
+    def flush(self):
+        if getattr(_output, 'buffer', None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def _with_current_output(func):
+    """Wrap func so that, when run on a helper thread, its output goes to the calling thread's buffer"""
+    buffer = getattr(_output, 'buffer', None)
+    def wrapper(*args, **kwargs):
+        _output.buffer = buffer
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _output.buffer = None
+    return wrapper
 
 def test_basic_imports():
-    """Test all required imports"""
-    print("Testing basic imports...")
-    try:
-        import nltk
-        import pytesseract
-        import fitz
-        import docx
-        import pandas as pd
-        from pptx import Presentation
-        from PIL import Image
-        from nexa.gguf import NexaVLMInference, NexaTextInference
-        from rich.progress import Progress
-        print("PASS: All imports successful")
-        return True
-    except Exception as e:
-        print(f"FAIL: Import failed: {e}")
+    """Test all required imports, timing each one"""
+    print(f"{SYMBOLS['test']}Testing basic imports...")
+    modules = [
+        "nltk",
+        "pytesseract",
+        "fitz",
+        "docx",
+        "pandas",
+        "pptx",
+        "PIL.Image",
+        "rich.progress",
+    ]
+    # Only check these can be found: importing nexa.gguf initializes the inference
+    # backend, which test_model_initialization does when it needs the model
+    locate_only = ["nexa.gguf"]
+    failed = []
+    for module in modules + locate_only:
+        start = time.perf_counter()
+        try:
+            if module in locate_only:
+                if importlib.util.find_spec(module) is None:
+                    raise ImportError(f"No module named '{module}'")
+            else:
+                importlib.import_module(module)
+        except Exception as e:
+            print(f"{SYMBOLS['fail']}Import of {module} failed: {e}")
+            failed.append(module)
+            continue
+        elapsed = time.perf_counter() - start
+        print(f"{SYMBOLS['step']}{module}: {elapsed * 1000:.0f} ms")
+
+    if failed:
+        print(f"{SYMBOLS['fail']}{len(failed)} import(s) failed: {failed}")
         return False
+    print(f"{SYMBOLS['pass']}All imports successful")
+    return True
 
 def test_nltk_data():
     """Ensure NLTK data is downloaded"""
-    print("🔍 Testing NLTK data...")
+    print(f"{SYMBOLS['test']}Testing NLTK data...")
     import nltk
-    required_data = ['punkt', 'stopwords', 'wordnet']
-    missing = []
-    
-    for data in required_data:
-        try:
-            if data == 'punkt':
-                nltk.data.find('tokenizers/punkt')
-            elif data == 'stopwords':
-                nltk.data.find('corpora/stopwords')
-            elif data == 'wordnet':
-                nltk.data.find('corpora/wordnet')
-        except:
-            missing.append(data)
+
+    # Scan each NLTK data directory once rather than calling nltk.data.find() per item
+    subdirs = {rel.partition('/')[0] for rel in _NLTK_PATHS.values()}
+    present = set()
+    for root in nltk.data.path:
+        for sub in subdirs:
+            path = os.path.join(root, sub)
+            if os.path.isdir(path):
+                try:
+                    with os.scandir(path) as entries:
+                        # Packages may also be installed as zip archives
+                        present.update(f"{sub}/{entry.name.removesuffix('.zip')}" for entry in entries)
+                except OSError:
+                    continue  # Skip unreadable directories, as nltk.data.find() does
+    missing = [name for name, rel in _NLTK_PATHS.items() if rel not in present]
     
     if missing:
-        print(f"⚠️  Missing NLTK data: {missing}")
-        print("   Downloading...")
-        for data in missing:
-            nltk.download(data, quiet=True)
-        print("✅ NLTK data downloaded")
+        print(f"{SYMBOLS['warn']}Missing NLTK data: {missing}")
+        print(f"{SYMBOLS['step']}Downloading...")
+        # Download concurrently, giving each thread its own Downloader rather than
+        # sharing the module-level instance behind nltk.download
+        from nltk.downloader import Downloader
+        with ThreadPoolExecutor(max_workers=min(4, len(missing))) as executor:
+            download = _with_current_output(lambda data: Downloader().download(data, quiet=True))
+            list(executor.map(download, missing))
+        print(f"{SYMBOLS['pass']}NLTK data downloaded")
     else:
-        print("✅ NLTK data available")
+        print(f"{SYMBOLS['pass']}NLTK data available")
     return True
 
 def test_file_processing():
     """Test file reading capabilities"""
-    print("🔍 Testing file processing...")
+    print(f"{SYMBOLS['test']}Testing file processing...")
+    # Check for sample data before importing file_utils, which pulls in pandas, fitz, etc.
+    sample_path = 'sample_data'
+    if not os.path.exists(sample_path):
+        print(f"{SYMBOLS['warn']}sample_data directory not found")
+        return True
+    
     try:
         from file_utils import read_file_data, collect_file_paths
         
-        # Test with sample data
-        sample_path = 'sample_data'
-        if os.path.exists(sample_path):
-            files = collect_file_paths(sample_path)
-            print(f"✅ Found {len(files)} files in sample_data")
-            
-            # Test reading a few files
-            for file_path in files[:3]:
-                try:
-                    content = read_file_data(file_path)
-                    if content:
-                        print(f"✅ Successfully read {os.path.basename(file_path)}")
-                    else:
-                        print(f"⚠️  Could not read content from {os.path.basename(file_path)}")
-                except Exception as e:
-                    print(f"❌ Error reading {os.path.basename(file_path)}: {e}")
-        else:
-            print("⚠️  sample_data directory not found")
+        files = collect_file_paths(sample_path)
+        print(f"{SYMBOLS['pass']}Found {len(files)} files in sample_data")
+        
+        # Test reading a few files
+        success_count = 0
+        for file_path in files[:3]:
+            name = os.path.basename(file_path)
+            try:
+                content = read_file_data(file_path)
+                if content:
+                    print(f"{SYMBOLS['pass']}Successfully read {name}")
+                    success_count += 1
+                else:
+                    print(f"{SYMBOLS['warn']}Could not read content from {name}")
+            except Exception as e:
+                print(f"{SYMBOLS['fail']}Error reading {name}: {e}")
         
+        if success_count > 0:
+            print(f"{SYMBOLS['pass']}Successfully read {success_count} files")
         return True
     except Exception as e:
-        print(f"❌ File processing test failed: {e}")
-        traceback.print_exc()
+        print(f"{SYMBOLS['fail']}File processing test failed: {type(e).__name__}: {e}")
+        if VERBOSE:
+            traceback.print_exc()
         return False
 
 def test_model_initialization():
     """Test AI model initialization"""
-    print("🔍 Testing AI model initialization...")
+    print(f"{SYMBOLS['test']}Testing AI model initialization...")
     try:
-        from nexa.gguf import NexaVLMInference, NexaTextInference
-        from output_filter import filter_specific_output
+        from diagnostic_common import get_text_model
         
-        print("   Initializing text model...")
-        with filter_specific_output():
-            text_inference = NexaTextInference(
-                model_path="Llama3.2-3B-Instruct:q3_K_M",
-                local_path=None,
-                stop_words=[],
-                temperature=0.5,
-                max_new_tokens=100,  # Reduced for testing
-                top_k=3,
-                top_p=0.3,
-                profiling=False
-            )
-        print("✅ Text model initialized successfully")
+        print(f"{SYMBOLS['step']}Initializing text model...")
+        text_inference = get_text_model()
+        print(f"{SYMBOLS['pass']}Text model initialized successfully")
         
         # Test a simple completion
-        print("   Testing text completion...")
+        print(f"{SYMBOLS['step']}Testing text completion...")
         response = text_inference.create_completion("Hello, this is a test.")
         if response and 'choices' in response:
-            print("✅ Text model completion works")
+            print(f"{SYMBOLS['pass']}Text model completion works")
         else:
-            print("⚠️  Text model completion returned unexpected format")
+            print(f"{SYMBOLS['warn']}Text model completion returned unexpected format")
         
         return True
         
     except Exception as e:
-        print(f"❌ Model initialization failed: {e}")
-        traceback.print_exc()
+        print(f"{SYMBOLS['fail']}Model initialization failed: {type(e).__name__}: {e}")
+        if VERBOSE:
+            traceback.print_exc()
         return False
 
 def create_minimal_test():
     """Create a minimal working test"""
-    print("🔍 Creating minimal test with sample data...")
+    print(f"{SYMBOLS['test']}Creating minimal test with sample data...")
+    # Check for sample data before importing the processing modules
+    sample_path = 'sample_data'
+    if not os.path.exists(sample_path):
+        print(f"{SYMBOLS['fail']}sample_data directory not found")
+        return False
+    
     try:
-        from file_utils import collect_file_paths, separate_files_by_type
+        from file_utils import scan_file_entries
         from data_processing_common import process_files_by_date, process_files_by_type
         
-        sample_path = 'sample_data'
-        if not os.path.exists(sample_path):
-            print("❌ sample_data directory not found")
-            return False
-        
-        files = collect_file_paths(sample_path)
-        print(f"✅ Collected {len(files)} files")
+        # Take modification times from the walk so files are only stat'ed once
+        entries = list(scan_file_entries(sample_path))
+        files = [entry.path for entry in entries]
+        mtimes = [entry.stat().st_mtime for entry in entries]
+        print(f"{SYMBOLS['pass']}Collected {len(files)} files")
         
         # Test date-based organization (no AI needed)
-        print("   Testing date-based organization...")
+        print(f"{SYMBOLS['step']}Testing date-based organization...")
         output_path = 'test_output'
-        operations = process_files_by_date(files, output_path)
-        print(f"✅ Generated {len(operations)} file operations")
+        operations = process_files_by_date(files, output_path, mtimes=mtimes)
+        print(f"{SYMBOLS['pass']}Generated {len(operations)} file operations")
         
         # Test type-based organization (no AI needed)
-        print("   Testing type-based organization...")
+        print(f"{SYMBOLS['step']}Testing type-based organization...")
         operations = process_files_by_type(files, output_path)
-        print(f"✅ Generated {len(operations)} file operations")
+        print(f"{SYMBOLS['pass']}Generated {len(operations)} file operations")
         
-        print("✅ Minimal test completed successfully")
+        print(f"{SYMBOLS['pass']}Minimal test completed successfully")
         return True
         
     except Exception as e:
-        print(f"❌ Minimal test failed: {e}")
-        traceback.print_exc()
+        print(f"{SYMBOLS['fail']}Minimal test failed: {type(e).__name__}: {e}")
+        if VERBOSE:
+            traceback.print_exc()
         return False
 
+def run_test(name, test_func, buffered=False):
+    """Run a single test, returning whether it passed and how long it took in ms.
+
+    With buffered=True the test's output is held back and printed as one block
+    when it finishes, so tests running in parallel don't interleave. This relies
+    on sys.stdout and sys.stderr being _ThreadRoutedStream instances, as set up
+    by main() around the test pool.
+    """
+    if buffered:
+        _output.buffer = io.StringIO()
+    try:
+        print(f"\n{SYMBOLS['run']}Running {name} test...")
+        start = time.perf_counter_ns()
+        try:
+            success = test_func()
+        except Exception as e:
+            print(f"{SYMBOLS['fail']}{name} test crashed: {type(e).__name__}: {e}")
+            if VERBOSE:
+                traceback.print_exc()
+            success = False
+        return success, (time.perf_counter_ns() - start) / 1e6
+    finally:
+        if buffered:
+            text = _output.buffer.getvalue()
+            _output.buffer = None
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
 def main():
     """Run all diagnostic tests"""
+    parser = argparse.ArgumentParser(description="Local File Organizer diagnostic tool")
+    parser.add_argument("--with-model", action="store_true",
+                        help="also load the text model and run a test completion (slow, needs several GB of RAM)")
+    parser.add_argument("--format", choices=sorted(_FORMATS), default="rich",
+                        help="output style; 'plain' uses PASS/FAIL text instead of emoji")
+    args = parser.parse_args()
+    SYMBOLS.update(_FORMATS[args.format])
+    
     print("Local File Organizer Diagnostic Tool")
     print("=" * 50)
     
-    tests = [
-        ("Basic Imports", test_basic_imports),
+    # Independent, I/O-bound tests that can run concurrently
+    parallel_tests = [
         ("NLTK Data", test_nltk_data),
         ("File Processing", test_file_processing),
+    ]
+    # Run afterwards, once the imports above are warm
+    serial_tests = [
         ("Minimal Test", create_minimal_test),
         ("Model Initialization", test_model_initialization),
     ]
+    if not args.with_model:
+        serial_tests = [t for t in serial_tests if t[0] != "Model Initialization"]
+        print(f"{SYMBOLS['hint']}Model initialization skipped; pass --with-model to include it")
     
-    results = []
-    for name, test_func in tests:
-        print(f"\n📋 Running {name} test...")
-        try:
-            success = test_func()
-            results.append((name, success))
-        except Exception as e:
-            print(f"❌ {name} test crashed: {e}")
-            results.append((name, False))
+    # Run alone first so its per-module import timings aren't skewed by other tests
+    results = [("Basic Imports", *run_test("Basic Imports", test_basic_imports))]
     
-    print("\n" + "=" * 50)
-    print("📊 DIAGNOSTIC SUMMARY")
-    print("=" * 50)
+    # Route writes through per-thread buffers while the pool runs, so every line a
+    # test produces, including library output and tracebacks, prints in one block
+    original_streams = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _ThreadRoutedStream(sys.stdout), _ThreadRoutedStream(sys.stderr)
+    try:
+        with ThreadPoolExecutor(max_workers=len(parallel_tests)) as executor:
+            futures = [
+                (name, executor.submit(run_test, name, test_func, buffered=True))
+                for name, test_func in parallel_tests
+            ]
+            results += [(name, *future.result()) for name, future in futures]
+    finally:
+        sys.stdout, sys.stderr = original_streams
+    
+    for name, test_func in serial_tests:
+        results.append((name, *run_test(name, test_func)))
     
-    all_passed = True
-    for name, success in results:
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {name}")
-        if not success:
-            all_passed = False
+    # Assemble the summary and write it out in a single call
+    lines = ["", "=" * 50, f"{SYMBOLS['summary']}DIAGNOSTIC SUMMARY", "=" * 50]
+    lines += [
+        f"{SYMBOLS['passed' if success else 'failed']}{name} ({ms:.0f} ms)"
+        for name, success, ms in results
+    ]
+    all_passed = all(success for _, success, _ in results)
     
     if all_passed:
-        print("\n🎉 All tests passed! The application should work.")
-        print("💡 Try running: python main.py")
+        lines += [
+            "",
+            f"{SYMBOLS['done']}All tests passed! The application should work.",
+            f"{SYMBOLS['hint']}Try running: python main.py",
+        ]
     else:
-        print("\n⚠️  Some tests failed. Check the errors above.")
-        print("💡 Try the fixes suggested for each failed test.")
+        lines += [
+            "",
+            f"{SYMBOLS['warn']}Some tests failed. Check the errors above.",
+            f"{SYMBOLS['hint']}Common fixes:",
+            "1. Install missing packages: pip install -r requirements.txt",
+            "2. Check Python version (requires 3.12+)",
+            "3. Install Tesseract OCR if needed",
+        ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return all_passed
 
@@ -0,0 +1,22 @@
+# diagnostic_common.py
+
+import functools
+
+@functools.lru_cache(maxsize=1)
+def get_text_model():
+    """Load the application's text model for the diagnostics, reusing it on later calls in the same process."""
+    from nexa.gguf import NexaTextInference
+    from output_filter import filter_specific_output
+    from model_config import TEXT_MODEL_PATH
+
+    with filter_specific_output():
+        return NexaTextInference(
+            model_path=TEXT_MODEL_PATH,
+            local_path=None,
+            stop_words=[],
+            temperature=0.0,  # Greedy decoding; the test only checks the response shape
+            max_new_tokens=1,
+            top_k=1,
+            top_p=0.3,
+            profiling=False
+        )
@@ -105,17 +105,32 @@ def display_directory_tree(path):
     else:
         print(os.path.abspath(path))
 
+def scan_file_entries(base_path):
+    """Yield os.DirEntry objects for all files under base_path, excluding hidden files."""
+    stack = [base_path]
+    while stack:
+        dir_path = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked directories
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif not entry.name.startswith('.'):  # Exclude hidden files
+                        yield entry
+        except OSError:
+            continue  # Skip unreadable directories, as os.walk does
+        # Push in reverse so subdirectories are visited in the same order as os.walk
+        stack.extend(reversed(subdirs))
+
 def collect_file_paths(base_path):
     """Collect all file paths from the base directory or single file, excluding hidden files."""
     if os.path.isfile(base_path):
         return [base_path]
     else:
-        file_paths = []
-        for root, _, files in os.walk(base_path):
-            for file in files:
-                if not file.startswith('.'):  # Exclude hidden files
-                    file_paths.append(os.path.join(root, file))
-        return file_paths
+        return [entry.path for entry in scan_file_entries(base_path)]
 
 def separate_files_by_type(file_paths):
     """Separate files into images and text files based on their extensions."""
@@ -24,6 +24,7 @@ from image_data_processing import (
 )
 
 from output_filter import filter_specific_output  # Import the context manager
+from model_config import IMAGE_MODEL_PATH, TEXT_MODEL_PATH
 from nexa.gguf import NexaVLMInference, NexaTextInference  # Import model classes
 
 def ensure_nltk_data():
@@ -42,8 +43,8 @@ def initialize_models():
     global image_inference, text_inference
     if image_inference is None or text_inference is None:
         # Initialize the models
-        model_path = "llava-v1.6-vicuna-7b:q4_0"
-        model_path_text = "Llama3.2-3B-Instruct:q3_K_M"
+        model_path = IMAGE_MODEL_PATH
+        model_path_text = TEXT_MODEL_PATH
 
         # Use the filter_specific_output context manager
         with filter_specific_output():
@@ -0,0 +1,5 @@
+# model_config.py
+
+# Nexa SDK model identifiers, shared by main.py and the diagnostics so they load the same models
+IMAGE_MODEL_PATH = "llava-v1.6-vicuna-7b:q4_0"
+TEXT_MODEL_PATH = "Llama3.2-3B-Instruct:q3_K_M"
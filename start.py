@@ -19,32 +19,32 @@ def test_run():
         print("Please make sure you're in the right directory")
         return False
     
-    print(f"PASS: Found sample data: {len(os.listdir(sample_path))} items")
-    
     # Import the main modules
     try:
-        from file_utils import collect_file_paths
+        from file_utils import scan_file_entries
         from data_processing_common import process_files_by_date, process_files_by_type
         print("PASS: Modules imported successfully")
     except Exception as e:
         print(f"ERROR: Import failed: {e}")
         return False
     
-    # Test with sample data
-    files = collect_file_paths(sample_path)
-    print(f"PASS: Found {len(files)} files to organize")
+    # Walk the sample data once; the immutable results are shared by every step below
+    entries = tuple(scan_file_entries(sample_path))
+    files = tuple(entry.path for entry in entries)
+    mtimes = tuple(entry.stat().st_mtime for entry in entries)
+    print(f"PASS: Found sample data: {len(files)} files to organize")
     
     # Show what files we found
     print("\nFiles found:")
-    for i, file_path in enumerate(files[:5]):  # Show first 5
-        print(f"  {i+1}. {os.path.basename(file_path)}")
+    for i, entry in enumerate(entries[:5]):  # Show first 5
+        print(f"  {i+1}. {entry.name}")
     if len(files) > 5:
         print(f"  ... and {len(files) - 5} more")
     
     # Test date-based organization
     print(f"\nTesting date-based organization...")
     output_path = 'test_organized_output'
-    operations = process_files_by_date(files, output_path)
+    operations = process_files_by_date(files, output_path, mtimes=mtimes)
     print(f"PASS: Generated {len(operations)} operations for date-based organization")
     
     # Test type-based organization  
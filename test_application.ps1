@@ -328,7 +328,7 @@ call "$ActivateScript" $CondaEnv && python diagnostic_simple.py
     if ($FullTest) {
         Write-ColorText "Running diagnostic.py (full test)..." $Yellow
         $fullTestCmd = @"
-call "$ActivateScript" $CondaEnv && python diagnostic.py
+call "$ActivateScript" $CondaEnv && python diagnostic.py --with-model
 "@
         
         $result = cmd /c $fullTestCmd 2>&1